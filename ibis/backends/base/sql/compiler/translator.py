@@ -251,8 +251,7 @@ class ExprTranslator:
         elif isinstance(op, ops.TableNode):
             # HACK/TODO: revisit for more complex cases
             return "*"
-        elif type(op) in self._registry:
-            formatter = self._registry[type(op)]
+        elif (formatter := self._registry.get(type(op))) is not None:
             return formatter(self, op)
         else:
             raise com.OperationNotDefinedError(f"No translation rule for {type(op)}")
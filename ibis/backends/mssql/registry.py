@@ -15,17 +15,30 @@ from ibis.backends.base.sql.alchemy import (
 )
 from ibis.backends.base.sql.alchemy.registry import substr, variance_reduction
 
+# resolve the SQL functions used in the translation rules once, rather than
+# going through `sa.func.__getattr__` on every translation
+_datepart = sa.func.datepart
+_datediff = sa.func.datediff
+_dateadd = sa.func.dateadd
+_datetrunc = sa.func.datetrunc
+_hashbytes_func = sa.func.hashbytes
+
+_one = ops.Literal(1, dt.int8)
+_zero = ops.Literal(0, dt.int8)
+
 
 def _reduction(func, cast_type="int32"):
+    cast_dtype = dt.dtype(cast_type)
+
     def reduction_compiler(t, op):
         arg, where = op.args
 
         if arg.dtype.is_boolean():
             if isinstance(arg, ops.TableColumn):
                 nullable = arg.dtype.nullable
-                arg = ops.Cast(arg, dt.dtype(cast_type)(nullable=nullable))
+                arg = ops.Cast(arg, cast_dtype(nullable=nullable))
             else:
-                arg = ops.IfElse(arg, 1, 0)
+                arg = ops.IfElse(arg, _one, _zero)
 
         if where is not None:
             arg = ops.IfElse(where, arg, None)
@@ -64,12 +77,14 @@ def _string_find(t, op):
 
 
 def _extract(fmt):
+    # sa.literal_column is used because it makes the argument pass
+    # in NOT as a parameter
+    part = _literal_column(fmt)
+
     def translator(t, op):
         (arg,) = op.args
         sa_arg = t.translate(arg)
-        # sa.literal_column is used because it makes the argument pass
-        # in NOT as a parameter
-        return sa.cast(sa.func.datepart(sa.literal_column(fmt), sa_arg), sa.SMALLINT)
+        return sa.cast(_datepart(part, sa_arg), sa.SMALLINT)
 
     return translator
 
@@ -85,9 +100,9 @@ def _round(t, op):
 
 def _timestamp_from_unix(x, unit="s"):
     if unit == "s":
-        return sa.func.dateadd(sa.text("s"), x, "1970-01-01 00:00:00")
+        return _dateadd(sa.text("s"), x, "1970-01-01 00:00:00")
     if unit == "ms":
-        return sa.func.dateadd(sa.text("s"), x / 1_000, "1970-01-01 00:00:00")
+        return _dateadd(sa.text("s"), x / 1_000, "1970-01-01 00:00:00")
     raise com.UnsupportedOperationError(f"{unit!r} unit is not supported!")
 
 
@@ -104,6 +119,26 @@ _interval_units = {
     "Y": "year",
 }
 
+_interval_text_cache = {unit: sa.text(name) for unit, name in _interval_units.items()}
+
+# literal columns are immutable, so the ones used for date parts can be
+# shared across translations instead of being rebuilt for every operation
+_literal_column_cache = {
+    name: sa.literal_column(name)
+    for name in (
+        *_interval_units.values(),
+        "dayofyear",
+        "iso_week",
+        "CAST('1970-01-01' AS DATETIME2)",
+    )
+}
+
+
+def _literal_column(text):
+    if (column := _literal_column_cache.get(text)) is not None:
+        return column
+    return sa.literal_column(text)
+
 
 def _timestamp_truncate(t, op):
     arg = t.translate(op.arg)
@@ -111,7 +146,7 @@ def _timestamp_truncate(t, op):
     if unit not in _interval_units:
         raise com.UnsupportedOperationError(f"Unsupported truncate unit {op.unit!r}")
 
-    return sa.func.datetrunc(sa.text(_interval_units[unit]), arg)
+    return _datetrunc(_interval_text_cache[unit], arg)
 
 
 def _timestamp_bucket(t, op):
@@ -129,18 +164,40 @@ def _timestamp_bucket(t, op):
             "Timestamp bucket with offset is not supported"
         )
 
-    part = sa.literal_column(_interval_units[unit])
+    part = _literal_column(_interval_units[unit])
     value = sa.literal_column(str(op.interval.value))
     arg = t.translate(op.arg)
-    origin = sa.literal_column("CAST('1970-01-01' AS DATETIME2)")
+    origin = _literal_column("CAST('1970-01-01' AS DATETIME2)")
 
     return sa.func.DATE_BUCKET(part, value, arg, origin)
 
 
+# prebuilt DATEDIFF parts, keyed on the part names accepted by `delta`
+_delta_parts = {
+    part: _literal_column(part.upper())
+    for part in (
+        "year",
+        "quarter",
+        "month",
+        "week",
+        "day",
+        "hour",
+        "minute",
+        "second",
+        "millisecond",
+        "microsecond",
+        "nanosecond",
+    )
+}
+
+
 def _temporal_delta(t, op):
     left = t.translate(op.left)
     right = t.translate(op.right)
-    return sa.func.datediff(sa.literal_column(op.part.value.upper()), right, left)
+    part = op.part.value
+    if (column := _delta_parts.get(part)) is None:
+        column = sa.literal_column(part.upper())
+    return _datediff(column, right, left)
 
 
 def _not(t, op):
@@ -226,36 +283,35 @@ def _literal(_, op):
     return sa.literal(value)
 
 
+_hash_names = {
+    "md5": "md5",
+    "sha1": "sha1",
+    "sha256": "sha2_256",
+    "sha512": "sha2_512",
+}
+
+
 def _hashbytes(translator, op):
     how = op.how
 
-    arg_formatted = translator.translate(op.arg)
-
-    if how in ("md5", "sha1"):
-        return sa.func.hashbytes(how, arg_formatted)
-    elif how == "sha256":
-        return sa.func.hashbytes("sha2_256", arg_formatted)
-    elif how == "sha512":
-        return sa.func.hashbytes("sha2_512", arg_formatted)
-    else:
+    if (name := _hash_names.get(how)) is None:
         raise NotImplementedError(how)
 
+    arg_formatted = translator.translate(op.arg)
+    return _hashbytes_func(name, arg_formatted)
+
 
 def _hexdigest(translator, op):
     # SO post on getting convert to play nice with VARCHAR in Sqlalchemy
     # https://stackoverflow.com/questions/20291962/how-to-use-convert-function-in-sqlalchemy
     how = op.how
 
-    arg_formatted = translator.translate(op.arg)
-    if how in ("md5", "sha1"):
-        hashbinary = sa.func.hashbytes(how, arg_formatted)
-    elif how == "sha256":
-        hashbinary = sa.func.hashbytes("sha2_256", arg_formatted)
-    elif how == "sha512":
-        hashbinary = sa.func.hashbytes("sha2_512", arg_formatted)
-    else:
+    if (name := _hash_names.get(how)) is None:
         raise NotImplementedError(how)
 
+    arg_formatted = translator.translate(op.arg)
+    hashbinary = _hashbytes_func(name, arg_formatted)
+
     # mssql uppercases the hexdigest which is inconsistent with several other
     # implementations and inconsistent with Python, so lowercase it.
     return sa.func.lower(
@@ -334,11 +390,11 @@ operation_registry.update(
         ops.ExtractMillisecond: _extract("millisecond"),
         ops.ExtractWeekOfYear: _extract("iso_week"),
         ops.DayOfWeekIndex: fixed_arity(
-            lambda x: sa.func.datepart(sa.text("weekday"), x) - 1, 1
+            lambda x: _datepart(sa.text("weekday"), x) - 1, 1
         ),
         ops.ExtractEpochSeconds: fixed_arity(
             lambda x: sa.cast(
-                sa.func.datediff(sa.text("s"), "1970-01-01 00:00:00", x), sa.BIGINT
+                _datediff(sa.text("s"), "1970-01-01 00:00:00", x), sa.BIGINT
             ),
             1,
         ),
@@ -360,7 +416,7 @@ operation_registry.update(
         ops.HashBytes: _hashbytes,
         ops.HexDigest: _hexdigest,
         ops.ExtractMicrosecond: fixed_arity(
-            lambda arg: sa.func.datepart(sa.literal_column("microsecond"), arg), 1
+            lambda arg: _datepart(_literal_column("microsecond"), arg), 1
         ),
         ops.TimeDelta: _temporal_delta,
         ops.DateDelta: _temporal_delta,
@@ -382,6 +438,5 @@ _invalid_operations = {
     ops.NthValue,
 }
 
-operation_registry = {
-    k: v for k, v in operation_registry.items() if k not in _invalid_operations
-}
+for _op in _invalid_operations:
+    operation_registry.pop(_op, None)
@@ -3,11 +3,13 @@ from __future__ import annotations
 import pytest
 import sqlalchemy as sa
 from pytest import param
+from sqlalchemy.dialects import mssql
 
 import ibis
 import ibis.expr.datatypes as dt
 from ibis import udf
 from ibis.backends.base.sql.alchemy.geospatial import geospatial_supported
+from ibis.backends.mssql.compiler import MsSqlCompiler
 
 DB_TYPES = [
     # Exact numbers
@@ -140,3 +142,25 @@ def test_glorious_length_function_hack(con, string):
     expr = lit.length()
     result = con.execute(expr)
     assert result == len(string)
+
+
+def test_compiled_statement_is_cached():
+    t = ibis.table({"a": "int64", "b": "string", "c": "timestamp"}, name="t")
+    expr = t.filter(t.a > 1).select(
+        s=t.b.substr(1, 2),
+        y=t.c.year(),
+        d=t.c.truncate("D"),
+        h=t.b.hexdigest("sha256"),
+        n=t.c.delta(t.c, "day"),
+    )
+    query = MsSqlCompiler.to_sql(expr)
+
+    dialect = mssql.dialect()
+    assert dialect.supports_statement_cache
+
+    cache = {}
+    stats = [
+        query._compile_w_cache(dialect, compiled_cache=cache, column_keys=[])[-1]
+        for _ in range(2)
+    ]
+    assert stats == [dialect.CACHE_MISS, dialect.CACHE_HIT]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import itertools
-import operator
+from collections.abc import Sized
 from functools import partial
 from typing import TYPE_CHECKING, Any
 
@@ -14,7 +14,7 @@ from ibis.backends.pandas.core import execute
 from ibis.backends.pandas.dispatch import execute_node
 
 if TYPE_CHECKING:
-    from collections.abc import Collection
+    from collections.abc import Iterable
 
 
 @execute_node.register(ops.Array, tuple)
@@ -25,21 +25,38 @@ def execute_array(op, cols, **kwargs):
     if length is None:
         return vals
 
-    def ensure_series(v):
-        if isinstance(v, pd.Series):
-            return v
-        else:
-            return pd.Series(v, index=range(length))
-
-    # pd.concat() can only handle array-likes.
-    # If we're given a scalar, we need to broadcast it as a Series.
-    df = pd.concat([ensure_series(v) for v in vals], axis=1)
-    return df.apply(lambda row: np.array(row, dtype=object), axis=1)
+    # Build the rows directly from the column values instead of going through
+    # `pd.concat` and `DataFrame.apply(axis=1)`, which constructs a Series per
+    # row. Scalars are repeated lazily to the length of the columns.
+    cols = [
+        v.to_numpy() if isinstance(v, pd.Series) else itertools.repeat(v, length)
+        for v in vals
+    ]
+    width = len(cols)
+    out = np.empty(length, dtype=object)
+    for i, row in enumerate(zip(*cols)):
+        # fill a preallocated 1D array, since `np.array` would stack rows of
+        # equal-length arrays into a 2D array
+        arr = np.empty(width, dtype=object)
+        for j, value in enumerate(row):
+            arr[j] = value
+        out[i] = arr
+    return pd.Series(out)
+
+
+def _array_lengths(data: pd.Series) -> pd.Series:
+    # `Series.str.len` still calls `len` on every row, but does so from a
+    # Cython loop that skips nulls; `Series.map` covers dtypes without the
+    # `.str` accessor
+    try:
+        return data.str.len()
+    except AttributeError:
+        return data.map(len, na_action="ignore")
 
 
 @execute_node.register(ops.ArrayLength, pd.Series)
 def execute_array_length(op, data, **kwargs):
-    return data.apply(len)
+    return _array_lengths(data)
 
 
 @execute_node.register(ops.ArrayLength, (list, np.ndarray))
@@ -49,7 +66,12 @@ def execute_array_length_scalar(op, data, **kwargs):
 
 @execute_node.register(ops.ArraySlice, pd.Series, int, (int, type(None)))
 def execute_array_slice(op, data, start, stop, **kwargs):
-    return data.apply(operator.itemgetter(slice(start, stop)))
+    return pd.Series(
+        [v[start:stop] for v in data.to_numpy()],
+        index=data.index,
+        name=data.name,
+        dtype=object,
+    )
 
 
 @execute_node.register(ops.ArraySlice, (list, np.ndarray), int, (int, type(None)))
@@ -59,6 +81,24 @@ def execute_array_slice_scalar(op, data, start, stop, **kwargs):
 
 @execute_node.register(ops.ArrayIndex, pd.Series, int)
 def execute_array_index(op, data, index, **kwargs):
+    values = data.to_numpy()
+    if (
+        len(values)
+        and isinstance(first := values[0], np.ndarray)
+        and first.ndim == 1
+        and all(
+            isinstance(value, np.ndarray) and value.shape == first.shape
+            for value in values
+        )
+    ):
+        # all arrays have the same shape, so the whole column can be indexed
+        # with a single take over the stacked arrays
+        if not -len(first) <= index < len(first):
+            return pd.Series(
+                [None] * len(data), index=data.index, dtype=object, name=data.name
+            )
+        return pd.Series(np.stack(values)[:, index], index=data.index, name=data.name)
+
     return data.apply(
         lambda array, index=index: (
             array[index] if -len(array) <= index < len(array) else None
@@ -79,18 +119,39 @@ def execute_node_contains_value_array(op, haystack, needle, **kwargs):
     return needle in haystack
 
 
-def _concat_iterables_to_series(*iters: Collection[Any]) -> pd.Series:
-    """Concatenate two collections to create a Series.
+def _concat_iterables_to_series(*iters: Iterable[Any]) -> pd.Series:
+    """Concatenate iterables to create a Series.
 
-    The two collections are assumed to have the same length.
+    The sized iterables are assumed to have the same length; unsized ones
+    (e.g., a broadcast scalar) are consumed in lockstep with them.
 
     Used for ArrayConcat implementation.
     """
-    first, *rest = iters
-    assert all(len(series) == len(first) for series in rest)
-    # Doing the iteration using `map` is much faster than doing the iteration
-    # using `Series.apply` due to Pandas-related overhead.
-    return pd.Series(map(lambda *args: np.concatenate(args), first, *rest))
+    sized = [it for it in iters if isinstance(it, Sized)]
+    n = len(sized[0])
+    assert all(len(it) == n for it in sized)
+    # Filling a preallocated object array is much faster than doing the
+    # iteration using `Series.apply` due to Pandas-related overhead, and avoids
+    # dtype inference when constructing a Series from an iterator.
+    out = np.empty(n, dtype=object)
+    for i, parts in enumerate(zip(*iters)):
+        out[i] = np.concatenate(parts)
+    return pd.Series(out)
+
+
+def _broadcast_concat(*args: Any) -> pd.Series:
+    """Concatenate a mix of array columns and array scalars.
+
+    Scalars are repeated lazily instead of being materialized to the length
+    of the columns.
+    """
+    n = next(len(arg) for arg in args if isinstance(arg, pd.Series))
+    return _concat_iterables_to_series(
+        *(
+            arg if isinstance(arg, pd.Series) else itertools.repeat(arg, n)
+            for arg in args
+        )
+    )
 
 
 @execute_node.register(ops.ArrayConcat, tuple)
@@ -109,32 +170,38 @@ def execute_array_concat_series(op, first, second, *args, **kwargs):
 def execute_array_concat_mixed_left(op, left, right, *args, **kwargs):
     # ArrayConcat given a column (pd.Series) and a scalar (np.ndarray).
     # We will broadcast the scalar to the length of the column.
-    # Broadcast `left` to the length of `right`
-    left = np.tile(left, (len(right), 1))
-    return _concat_iterables_to_series(left, right)
+    return _broadcast_concat(left, right, *args)
 
 
 @execute_node.register(
     ops.ArrayConcat, pd.Series, (list, np.ndarray), [(pd.Series, list, np.ndarray)]
 )
 def execute_array_concat_mixed_right(op, left, right, *args, **kwargs):
-    # Broadcast `right` to the length of `left`
-    right = np.tile(right, (len(left), 1))
-    return _concat_iterables_to_series(left, right)
+    return _broadcast_concat(left, right, *args)
 
 
 @execute_node.register(
     ops.ArrayConcat, (list, np.ndarray), (list, np.ndarray), [(list, np.ndarray)]
 )
 def execute_array_concat_scalar(op, left, right, *args, **kwargs):
-    return np.concatenate([left, right, *args])
+    # convert lists up front so that `np.concatenate` only sees ndarrays
+    arrs = [
+        arg if isinstance(arg, np.ndarray) else np.asarray(arg)
+        for arg in (left, right, *args)
+    ]
+    return np.concatenate(arrs)
 
 
 @execute_node.register(ops.ArrayRepeat, pd.Series, int)
 def execute_array_repeat(op, data, n, **kwargs):
     # Negative n will be treated as 0 (repeat will produce empty array)
     n = max(n, 0)
-    return pd.Series(np.tile(arr, n) for arr in data)
+    vals = data.to_numpy()
+    out = np.empty(len(vals), dtype=object)
+    _tile = np.tile
+    for i, arr in enumerate(vals):
+        out[i] = _tile(arr, n)
+    return pd.Series(out, index=data.index)
 
 
 @execute_node.register(ops.ArrayRepeat, (list, np.ndarray), int)
@@ -162,11 +229,17 @@ def execute_array_collect_groupby(op, data, where, aggcontext=None, **kwargs):
 
 @execute_node.register(ops.Unnest, pd.Series)
 def execute_unnest(op, data, **kwargs):
-    return data[data.map(lambda v: bool(len(v)), na_action="ignore")].explode()
+    return data[_array_lengths(data).fillna(0).astype(bool)].explode()
+
+
+def _flatten(v, _chain=itertools.chain.from_iterable, _list=list):
+    # Arrays of equal-length arrays may be stored as 2D ndarrays, which numpy
+    # can flatten without iterating over the inner arrays in Python
+    if isinstance(v, np.ndarray) and v.ndim == 2:
+        return _list(v.ravel())
+    return _list(_chain(v))
 
 
 @execute_node.register(ops.ArrayFlatten, pd.Series)
 def execute_array_flatten(op, data, **kwargs):
-    return data.map(
-        lambda v: list(itertools.chain.from_iterable(v)), na_action="ignore"
-    )
+    return data.map(_flatten, na_action="ignore")
@@ -67,6 +67,19 @@ def df():
                 np.array([], dtype="object"),
                 np.array(["c"], dtype="object"),
             ],
+            "array_of_float64_with_nulls": [
+                np.array([1.0, 2.0], dtype="float64"),
+                None,
+                np.array([], dtype="float64"),
+            ],
+            "array_of_array_of_int64": [
+                np.array([[1, 2], [3, 4]], dtype="int64"),
+                np.array(
+                    [np.array([5], dtype="int64"), np.array([6, 7], dtype="int64")],
+                    dtype="object",
+                ),
+                np.empty((0, 2), dtype="int64"),
+            ],
             "map_of_strings_integers": [{"a": 1, "b": 2}, None, {}],
             "map_of_integers_strings": [{}, None, {1: "a", 2: "b"}],
             "map_of_complex_values": [None, {"a": [1, 2, 3], "b": []}, {}],
@@ -209,6 +222,8 @@ t_schema = {
     "array_of_float64": dt.Array(dt.double),
     "array_of_int64": dt.Array(dt.int64),
     "array_of_strings": dt.Array(dt.string),
+    "array_of_float64_with_nulls": dt.Array(dt.double),
+    "array_of_array_of_int64": dt.Array(dt.Array(dt.int64)),
     "map_of_strings_integers": dt.Map(dt.string, dt.int64),
     "map_of_integers_strings": dt.Map(dt.int64, dt.string),
     "map_of_complex_values": dt.Map(dt.string, dt.Array(dt.int64)),
@@ -4,8 +4,10 @@ import numpy as np
 import numpy.testing as nt
 import pandas as pd
 import pytest
+from pytest import param
 
 import ibis
+from ibis.backends.pandas.core import execute
 from ibis.backends.pandas.tests.conftest import TestConf as tm
 
 
@@ -18,11 +20,36 @@ def test_array_literal(client, arr, create_arr_expr):
     nt.assert_array_equal(result, expected)
 
 
+def test_array_column(t, df):
+    expr = ibis.array([t.plain_int64, 1, t.dup_ints]).name("array_column")
+    result = expr.execute()
+    expected = pd.Series(
+        [
+            np.array([a, 1, b], dtype=object)
+            for a, b in zip(df.plain_int64, df.dup_ints)
+        ],
+        name="array_column",
+    )
+    tm.assert_series_equal(result, expected)
+
+
+def test_array_column_of_arrays(t, df):
+    expr = ibis.array([t.array_of_int64, t.array_of_int64])
+    result = execute(expr.op())
+    assert all(row.ndim == 1 and len(row) == 2 for row in result)
+    for row, expected in zip(result, df.array_of_int64):
+        for value in row:
+            nt.assert_array_equal(value, expected)
+
+
 def test_array_length(t):
     expr = t.select(
         t.array_of_float64.length().name("array_of_float64_length"),
         t.array_of_int64.length().name("array_of_int64_length"),
         t.array_of_strings.length().name("array_of_strings_length"),
+        t.array_of_float64_with_nulls.length().name(
+            "array_of_float64_with_nulls_length"
+        ),
     )
     result = expr.execute()
     expected = pd.DataFrame(
@@ -30,6 +57,7 @@ def test_array_length(t):
             "array_of_float64_length": [2, 1, 0],
             "array_of_int64_length": [2, 0, 1],
             "array_of_strings_length": [2, 0, 1],
+            "array_of_float64_with_nulls_length": [2, np.nan, 0],
         }
     )
 
@@ -52,6 +80,17 @@ def test_array_collect(t, df):
     nt.assert_array_equal(result, expected)
 
 
+def test_array_collect_does_not_alias_input(t, df):
+    source = df.float64_with_zeros.to_numpy()
+
+    result = t.float64_with_zeros.collect().execute()
+    assert not np.shares_memory(result, source)
+
+    expr = t.group_by(t.dup_strings).aggregate(collected=t.float64_with_zeros.collect())
+    for collected in expr.execute().collected:
+        assert not np.shares_memory(collected, source)
+
+
 def test_array_collect_grouped(t, df):
     expr = t.group_by(t.dup_strings).aggregate(collected=t.float64_with_zeros.collect())
     result = expr.execute().sort_values("dup_strings").reset_index(drop=True)
@@ -139,6 +178,35 @@ def test_array_index(t, df, index):
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("index", [0, 1, -2, 2, -3])
+@pytest.mark.parametrize(
+    ("column", "keys"),
+    [
+        param("array_of_float64", [1], id="numeric"),
+        # a 1D object row followed by a 2D numeric row of the same length
+        param("array_of_array_of_int64", [2, 1], id="mixed-shapes"),
+    ],
+)
+def test_array_index_same_length(t, df, column, keys, index):
+    expr = (
+        t.filter(t.plain_int64.isin(keys))
+        .order_by(ibis.desc("plain_int64"))[column][index]
+        .name("indexed")
+    )
+    result = execute(expr.op())
+    expected = (
+        df.set_index("plain_int64")
+        .loc[keys, column]
+        .apply(lambda x: x[index] if -len(x) <= index < len(x) else None)
+    )
+    assert len(result) == len(expected)
+    for res, exp in zip(result, expected):
+        if exp is None:
+            assert res is None
+        else:
+            nt.assert_array_equal(res, exp)
+
+
 @pytest.mark.parametrize("index", [1, 3, 4, 11])
 def test_array_index_scalar(client, index):
     raw_value = np.array([-10, 1, 2, 42])
@@ -197,6 +265,64 @@ def test_array_concat(t, df, op, op_raw):
     tm.assert_series_equal(result, expected)
 
 
+@pytest.mark.parametrize(
+    ("left", "right"),
+    [
+        param("array_of_int64", "array_of_int64", id="same-dtype"),
+        param("array_of_int64", "array_of_float64", id="mixed-dtype"),
+    ],
+)
+def test_array_concat_numeric(t, df, left, right):
+    expr = t[left] + t[right]
+    result = expr.execute()
+    expected = [np.concatenate([x, y]) for x, y in zip(df[left], df[right])]
+    assert len(result) == len(expected)
+    for res, exp in zip(result, expected):
+        nt.assert_array_equal(res, exp)
+
+
+@pytest.mark.parametrize(
+    ["op", "op_raw"],
+    [
+        (lambda x, y: x + y, lambda x, y: np.concatenate([x, y])),
+        (lambda x, y: y + x, lambda x, y: np.concatenate([y, x])),
+    ],
+)
+def test_array_concat_mixed(t, df, op, op_raw):
+    raw_scalar = np.array(["a", "b"])
+    x = t.array_of_strings
+    y = ibis.array(raw_scalar)
+    expr = op(x, y)
+    result = expr.execute()
+    expected = df.array_of_strings.apply(lambda arr: op_raw(arr, raw_scalar))
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    ["op", "op_raw"],
+    [
+        param(
+            lambda x, y: x + y + x,
+            lambda x, y: np.concatenate([x, y, x]),
+            id="column-scalar-column",
+        ),
+        param(
+            lambda x, y: y + x + y,
+            lambda x, y: np.concatenate([y, x, y]),
+            id="scalar-column-scalar",
+        ),
+    ],
+)
+def test_array_concat_mixed_three(t, df, op, op_raw):
+    raw_scalar = np.array(["a"])
+    x = t.array_of_strings
+    y = ibis.array(raw_scalar)
+    expr = op(x, y)
+    result = expr.execute()
+    expected = df.array_of_strings.apply(lambda arr: op_raw(arr, raw_scalar))
+    tm.assert_series_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     ["op", "op_raw"],
     [
@@ -213,3 +339,24 @@ def test_array_concat_scalar(client, op, op_raw):
     result = client.execute(expr)
     expected = op_raw(raw_left, raw_right)
     nt.assert_array_equal(result, expected)
+
+
+def test_array_flatten(t, df):
+    expr = t.array_of_array_of_int64.flatten()
+    result = expr.execute()
+    expected = df.array_of_array_of_int64.map(
+        lambda v: [x for inner in v for x in inner]
+    ).rename(expr.get_name())
+    tm.assert_series_equal(result, expected)
+    # 2D and ragged rows produce the same element types
+    assert all(isinstance(x, np.int64) for row in result for x in row)
+
+
+@pytest.mark.parametrize("column", ["array_of_float64", "array_of_float64_with_nulls"])
+def test_unnest(t, df, column):
+    expr = t[column].unnest()
+    result = expr.execute()
+    expected = pd.Series(
+        [x for v in df[column] if v is not None for x in v], name=expr.get_name()
+    )
+    tm.assert_series_equal(result.reset_index(drop=True), expected)